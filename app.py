@@ -3,27 +3,60 @@
 from __future__ import annotations
 
 import os
+import sys
+import time
 from pathlib import Path
 
-from dotenv import load_dotenv
 from flask import Flask, url_for
 
 BASE_DIR = Path(__file__).resolve().parent
 STATIC_DIR = BASE_DIR / "static"
 
-print("[env] FMP_KEY set:", bool(os.getenv("FMP_KEY")))
-print("[env] ALPHAVANTAGE_KEY set:", bool(os.getenv("ALPHAVANTAGE_KEY")))
+# Cache-busting versions for asset_url. Each template render stats every asset
+# it links; remembering the mtime for a few seconds keeps dev reloads working
+# while dropping the per-render syscalls.
+_ASSET_VERSION_TTL = 5.0
+_asset_versions: dict[str, tuple[float, int]] = {}
+
+
+def _asset_version(filename: str) -> int:
+    now = time.time()
+    cached = _asset_versions.get(filename)
+    if cached and now - cached[0] < _ASSET_VERSION_TTL:
+        return cached[1]
+    try:
+        version = int((STATIC_DIR / filename).stat().st_mtime)
+    except OSError:
+        version = 0
+    _asset_versions[filename] = (now, version)
+    return version
+
+if os.getenv("FINPULSE_DEBUG_ENV"):
+    sys.stderr.write(
+        f"[env] FMP={bool(os.getenv('FMP_KEY'))} AV={bool(os.getenv('ALPHAVANTAGE_KEY'))}\n"
+    )
 
 
 def create_app(test_config: dict | None = None) -> Flask:
+    # Imported lazily so that importing this module (e.g. from wsgi or tests)
+    # doesn't pay for dotenv until an app is actually built.
+    from dotenv import load_dotenv
+
+    dev_mode = os.getenv("FINPULSE_ENV", "dev") == "dev"
+
     # Attempt to load environment variables. Fall back to .env.gitignore when .env is absent
-    # so local sample keys are picked up during development.
-    if not load_dotenv():
-        load_dotenv(".env.gitignore")
+    # so local sample keys are picked up during development. Production deployments set
+    # FINPULSE_ENV=prod and provide real env vars, so skip the filesystem walk entirely.
+    if dev_mode:
+        if not load_dotenv():
+            load_dotenv(".env.gitignore")
 
     app = Flask(__name__, instance_relative_config=False)
-    app.config.setdefault("SEND_FILE_MAX_AGE_DEFAULT", 0)
-    app.config["TEMPLATES_AUTO_RELOAD"] = True
+    # In dev, disable caching so template/asset edits show up immediately; in
+    # prod, let Jinja skip the per-render template stat and give static files a
+    # real max-age (asset_url's ?v= busts them on deploy).
+    app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 0 if dev_mode else 43200
+    app.config["TEMPLATES_AUTO_RELOAD"] = dev_mode
 
     if test_config:
         app.config.update(test_config)
@@ -31,11 +64,7 @@ def create_app(test_config: dict | None = None) -> Flask:
     @app.context_processor
     def inject_asset_url():
         def asset_url(filename: str) -> str:
-            try:
-                version = int((STATIC_DIR / filename).stat().st_mtime)
-            except OSError:
-                version = 0
-            return url_for("static", filename=filename, v=version)
+            return url_for("static", filename=filename, v=_asset_version(filename))
 
         return {"asset_url": asset_url}
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from flask import Blueprint
+import gzip
+import os
+
+from flask import Blueprint, Response, jsonify, request
 
 from services.market_live import (
     live_energy_weekly,
@@ -9,38 +12,80 @@ from services.market_live import (
     live_top_movers,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 api_bp = Blueprint("api", __name__)
 
 
+def _json(payload) -> Response:
+    # orjson serializes in C straight to bytes; fall back to jsonify when absent.
+    if orjson is not None:
+        return Response(orjson.dumps(payload), mimetype="application/json")
+    return jsonify(payload)
+
+
+# Registered before _conditional_json on purpose: Flask runs after_request hooks
+# in reverse registration order, so the ETag is computed on the uncompressed body
+# and compression happens last (and is skipped entirely for 304s).
+@api_bp.after_request
+def _gzip_json(response: Response) -> Response:
+    if (
+        response.status_code != 200
+        or response.mimetype != "application/json"
+        or response.direct_passthrough
+        or "gzip" in response.headers.get("Content-Encoding", "")
+        or "gzip" not in request.headers.get("Accept-Encoding", "")
+    ):
+        return response
+    body = response.get_data()
+    if len(body) < 512:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=5))
+    response.headers["Content-Encoding"] = "gzip"
+    response.headers["Vary"] = "Accept-Encoding"
+    return response
+
+
+@api_bp.after_request
+def _conditional_json(response: Response) -> Response:
+    # Dashboard widgets poll these endpoints; tag responses so repeat pollers
+    # can short-circuit with 304 instead of re-downloading identical JSON.
+    if response.status_code == 200 and response.mimetype == "application/json":
+        response.add_etag()
+        return response.make_conditional(request)
+    return response
+
+
 @api_bp.get("/market/indexes")
 def api_market_indexes():
-    return live_index_ohlc()
+    return _json(live_index_ohlc())
 
 
 @api_bp.get("/market/energy_weekly")
 def api_market_energy_weekly():
-    return live_energy_weekly()
+    return _json(live_energy_weekly())
 
 
 @api_bp.get("/market/movers")
 def api_market_movers():
-    return live_top_movers()
+    return _json(live_top_movers())
 
 
 @api_bp.get("/market/heatmap")
 def api_market_heatmap():
-    return live_heatmap()
+    return _json(live_heatmap())
 
 
 @api_bp.get("/_diag")
 def api_diag():
-    import os
-
     idx = live_index_ohlc() or {}
     mv = live_top_movers() or []
     hm = live_heatmap() or []
     en = live_energy_weekly() or []
-    return {
+    return _json({
         "keys_set": {
             "FMP_KEY": bool(os.getenv("FMP_KEY")),
             "ALPHAVANTAGE_KEY": bool(os.getenv("ALPHAVANTAGE_KEY")),
@@ -49,4 +94,4 @@ def api_diag():
         "movers_live_len": len(mv),
         "heatmap_live_len": len(hm),
         "energy_live_len": len(en),
-    }
+    })
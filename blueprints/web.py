@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from datetime import datetime, time, timedelta
-from typing import Any, Dict
+from datetime import date, datetime, time, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 from zoneinfo import ZoneInfo
 
 from flask import Blueprint, redirect, render_template, url_for
@@ -11,13 +12,21 @@ web_bp = Blueprint("web", __name__)
 MARKET_TZ = ZoneInfo("America/New_York")
 MARKET_OPEN_TIME = time(hour=9, minute=30)
 MARKET_CLOSE_TIME = time(hour=16, minute=0)
+_STATUS_TTL_SECONDS = 30
 
 
 def _next_trading_day(day):
-    next_day = day + timedelta(days=1)
-    while next_day.weekday() >= 5:
-        next_day += timedelta(days=1)
-    return next_day
+    # Mon-Thu roll to the next day; Fri/Sat/Sun jump straight to Monday.
+    wd = day.weekday()
+    return day + timedelta(days=1 if wd < 4 else 7 - wd)
+
+
+@lru_cache(maxsize=64)
+def _market_bounds(day: date) -> Tuple[datetime, datetime]:
+    return (
+        datetime.combine(day, MARKET_OPEN_TIME, tzinfo=MARKET_TZ),
+        datetime.combine(day, MARKET_CLOSE_TIME, tzinfo=MARKET_TZ),
+    )
 
 
 def _format_market_event(ts: datetime, current: datetime) -> str:
@@ -28,9 +37,22 @@ def _format_market_event(ts: datetime, current: datetime) -> str:
 
 
 def compute_us_market_status(now: datetime | None = None) -> Dict[str, Any]:
-    current = now.astimezone(MARKET_TZ) if now else datetime.now(MARKET_TZ)
-    open_today = datetime.combine(current.date(), MARKET_OPEN_TIME, tzinfo=MARKET_TZ)
-    close_today = datetime.combine(current.date(), MARKET_CLOSE_TIME, tzinfo=MARKET_TZ)
+    if now is None:
+        # The status is rendered on every request via the context processor but
+        # only changes at minute-ish boundaries; collapse calls within a
+        # 30-second window to one computation.
+        bucket = int(datetime.now(MARKET_TZ).timestamp()) // _STATUS_TTL_SECONDS
+        return _cached_market_status(bucket)
+    return _compute_market_status(now.astimezone(MARKET_TZ))
+
+
+@lru_cache(maxsize=4)
+def _cached_market_status(bucket: int) -> Dict[str, Any]:
+    return _compute_market_status(datetime.now(MARKET_TZ))
+
+
+def _compute_market_status(current: datetime) -> Dict[str, Any]:
+    open_today, close_today = _market_bounds(current.date())
     trading_day = current.weekday() < 5
 
     if trading_day and open_today <= current < close_today:
@@ -44,7 +66,7 @@ def compute_us_market_status(now: datetime | None = None) -> Dict[str, Any]:
     else:
         is_open = False
         next_day = _next_trading_day(current.date())
-        next_event = datetime.combine(next_day, MARKET_OPEN_TIME, tzinfo=MARKET_TZ)
+        next_event = _market_bounds(next_day)[0]
         next_label = "Opens"
 
     descriptor = f"{next_label} {_format_market_event(next_event, current)}"
@@ -1,33 +1,65 @@
 from __future__ import annotations
-import os, time, requests
+import heapq, os, threading, time, requests
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Any, Dict, List, Optional, Tuple
 
+from requests.adapters import HTTPAdapter
+
 AV_BASE = "https://www.alphavantage.co/query"
 AV_KEY = lambda: os.getenv("ALPHAVANTAGE_KEY") or ""
+_AV_NOTICE_KEYS = ("Note", "Information", "Error Message")
+
+# One pooled session keeps TLS connections to Alpha Vantage alive across calls
+# (and across the sparkline worker threads) instead of handshaking per request.
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=16))
 
 # --- small cache to avoid throttling ---
+# Entries are (expiry, value): the deadline is fixed at insert so hits are a
+# single comparison and every waiter/reader agrees on freshness.
 _cache: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], Tuple[float, Any]] = {}
+_inflight: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], threading.Event] = {}
+_inflight_lock = threading.Lock()
 def _cache_get(url: str, params: Dict[str, Any], ttl: int = 60) -> Any:
     key = (url, tuple(sorted(params.items())))
-    now = time.time()
     if key in _cache:
-        ts, val = _cache[key]
-        if now - ts < ttl:
+        expiry, val = _cache[key]
+        if time.time() < expiry:
             return val
+    # Single-flight: concurrent misses for the same key share one upstream fetch
+    # instead of each hammering Alpha Vantage and burning rate limit.
+    while True:
+        with _inflight_lock:
+            event = _inflight.get(key)
+            if event is None:
+                event = _inflight[key] = threading.Event()
+                break
+        event.wait()
+        if key in _cache:
+            expiry, val = _cache[key]
+            if time.time() < expiry:
+                return val
     try:
-        r = requests.get(url, params=params, timeout=20)
-        r.raise_for_status()
-        js = r.json()
-        if isinstance(js, dict) and any(k in js for k in ("Note", "Information", "Error Message")):
-            print("[market_live] AV notice:", js.get("Note") or js.get("Information") or js.get("Error Message"))
-            _cache[key] = (now, None)
+        expiry = time.time() + ttl
+        try:
+            r = _session.get(url, params=params, timeout=20)
+            r.raise_for_status()
+            js = r.json()
+            if isinstance(js, dict) and any(k in js for k in _AV_NOTICE_KEYS):
+                print("[market_live] AV notice:", js.get("Note") or js.get("Information") or js.get("Error Message"))
+                _cache[key] = (expiry, None)
+                return None
+            _cache[key] = (expiry, js)
+            return js
+        except Exception as e:
+            print("[market_live] request failed:", url, "params=", params, "err=", repr(e))
+            _cache[key] = (expiry, None)
             return None
-        _cache[key] = (now, js)
-        return js
-    except Exception as e:
-        print("[market_live] request failed:", url, "params=", params, "err=", repr(e))
-        _cache[key] = (now, None)
-        return None
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+        event.set()
 
 def _parse_pct(raw) -> Optional[float]:
     try:
@@ -94,7 +126,9 @@ def _av_short_series(symbol: str, points: int = 6) -> List[float]:
     if not isinstance(ts, dict):
         return []
     closes = []
-    for dt in sorted(ts.keys())[-points:]:
+    # Only the newest few dates matter; pick them with a bounded heap instead
+    # of sorting all ~100 keys, then restore chronological order.
+    for dt in sorted(heapq.nlargest(points, ts)):
         row = ts[dt]
         try:
             closes.append(float(row.get("4. close") or row.get("close")))
@@ -120,14 +154,17 @@ def live_top_movers() -> List[Dict[str, Any]]:
         s = m["symbol"]
         if s not in seen or abs(m["pct"]) > abs(seen[s]["pct"]):
             seen[s] = m
-    out = list(seen.values())
-    out.sort(key=lambda x: abs(x["pct"]), reverse=True)
-    out = out[:8]
-    for m in out:
-        try:
-            m["series"] = _av_short_series(m["symbol"], points=6)
-        except Exception:
-            m["series"] = []
+    out = heapq.nlargest(8, seen.values(), key=lambda x: abs(x["pct"]))
+    if out:
+        # The sparkline calls are independent HTTP round trips; overlap them
+        # instead of paying one AV latency per mover.
+        with ThreadPoolExecutor(max_workers=min(8, len(out))) as executor:
+            futures = {executor.submit(_av_short_series, m["symbol"], 6): m for m in out}
+            for fut, m in futures.items():
+                try:
+                    m["series"] = fut.result()
+                except Exception:
+                    m["series"] = []
     print("[market_live] movers:", len(out))
     return out
 
@@ -154,7 +191,7 @@ def live_heatmap(limit_each: int = 20) -> List[Dict[str, Any]]:
         if s not in seen or abs(t["pct"]) > abs(seen[s]["pct"]):
             seen[s] = t
 
-    out = list(seen.values())[:60]
+    out = list(islice(seen.values(), 60))
     print("[heatmap] tiles:", len(out))
     return out
 